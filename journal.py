@@ -12,12 +12,48 @@ This version adds several features to help you learn:
 Each addition demonstrates different Python concepts.
 """
 
-import argparse
+import atexit
+import bisect
+import functools
 import json
-from datetime import datetime, timezone
+import mmap
+import os
+import re
+import struct
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import sys
-from typing import Generator, Optional
+from typing import Generator, Iterable, Optional
+
+# PERFORMANCE: orjson is a C JSON encoder that is several times faster than
+# the stdlib and emits UTF-8 bytes directly. It is optional — everything
+# falls back to the stdlib json module when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# PERFORMANCE: numpy (also optional) lets the mmap scan find every newline
+# in one vectorized pass instead of one find() call per line.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# PERFORMANCE: Bind the serializer pair to module-level names once, so call
+# sites pay a single global (or local, when re-bound in a hot loop) lookup
+# instead of deciding between orjson and the stdlib per call. The fallback
+# wraps the stdlib to speak bytes too, so all IO stays binary either way.
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    _loads = json.loads
 
 
 DEFAULT_LOG = "journal.jsonl"
@@ -29,12 +65,36 @@ def iso_timestamp() -> str:
     return datetime.now(timezone.utc).astimezone().isoformat(timespec="seconds")
 
 
+def _iso_timestamp_fast() -> str:
+    """
+    iso_timestamp without the datetime allocations.
+
+    PERFORMANCE: datetime.now(utc).astimezone().isoformat() builds two
+    datetime objects and a tzinfo conversion per call. Formatting straight
+    from time.localtime matters when add-batch stamps thousands of
+    entries in a row. Output is identical to iso_timestamp.
+    """
+    now = time.localtime()
+    offset = now.tm_gmtoff or 0
+    sign = "-" if offset < 0 else "+"
+    minutes = abs(offset) // 60
+    return (
+        time.strftime("%Y-%m-%dT%H:%M:%S", now)
+        + f"{sign}{minutes // 60:02d}:{minutes % 60:02d}"
+    )
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_timestamp(ts_string: str) -> Optional[datetime]:
     """
     Parse an ISO timestamp string back into a datetime object.
-    
+
     NEW CONCEPT: Optional[datetime] means "returns datetime OR None"
     This is a type hint that helps catch bugs.
+
+    PERFORMANCE: Second-resolution timestamps repeat a lot in bursty
+    journals, so results are memoized — a repeat costs a dict lookup
+    instead of a datetime.fromisoformat call.
     """
     try:
         return datetime.fromisoformat(ts_string)
@@ -42,6 +102,181 @@ def parse_timestamp(ts_string: str) -> Optional[datetime]:
         return None
 
 
+def _days_from_civil(year: int, month: int, day: int) -> int:
+    """Days since the Unix epoch for a proleptic Gregorian date."""
+    year -= month <= 2
+    era = (year if year >= 0 else year - 399) // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def _ts_to_ns(ts_string: str) -> Optional[int]:
+    """
+    UTC nanoseconds since the epoch for a 'YYYY-MM-DDTHH:MM:SS±HH:MM'
+    timestamp, parsed by fixed-field slicing.
+
+    PERFORMANCE: No datetime object is ever built, so the per-entry
+    --since comparison in replay becomes a plain integer compare instead
+    of datetime.__lt__ with tz normalization. A trailing 'Z' or no
+    offset at all is treated as UTC; anything else that is not exactly
+    this shape (fractional seconds, short offsets) returns None and
+    callers fall back to parse_timestamp.
+    """
+    try:
+        year = int(ts_string[0:4])
+        month = int(ts_string[5:7])
+        day = int(ts_string[8:10])
+        hour = int(ts_string[11:13])
+        minute = int(ts_string[14:16])
+        second = int(ts_string[17:19])
+        rest = ts_string[19:]
+        if rest and rest[0] in "+-" and len(rest) == 6:
+            offset = int(rest[1:3]) * 3600 + int(rest[4:6]) * 60
+            if rest[0] == "-":
+                offset = -offset
+        elif rest in ("", "Z"):
+            offset = 0
+        else:
+            return None
+    except ValueError:
+        return None
+
+    seconds = _days_from_civil(year, month, day) * 86400
+    seconds += hour * 3600 + minute * 60 + second - offset
+    return seconds * 1_000_000_000
+
+
+# Journals above this size are scanned through mmap instead of buffered IO.
+_MMAP_THRESHOLD = 1 << 20  # 1 MiB
+
+# Rotated archives with these suffixes are decompressed transparently on
+# the read path (gzip via the stdlib, zstd via the optional zstandard
+# package). They are read-only: add/add-batch refuse them.
+_COMPRESSED_SUFFIXES = (".gz", ".zst")
+
+
+def _open_compressed(log_path: Path):
+    """Open a .gz/.zst archive as a binary line-iterable stream."""
+    if log_path.suffix == ".zst":
+        try:
+            import zstandard
+        except ImportError:
+            raise OSError(
+                "reading .zst journals requires the zstandard package"
+            ) from None
+        import io
+
+        reader = zstandard.ZstdDecompressor().stream_reader(log_path.open("rb"))
+        return io.BufferedReader(reader)
+    import gzip
+
+    return gzip.open(log_path, "rb")
+
+# Field extractors for partial parsing of raw lines. We always write
+# "timestamp" first, and JSON escapes any quote inside string values, so a
+# plain byte match is reliable on lines this tool wrote. Anything that does
+# not match falls back to a full JSON parse.
+_TS_FIELD_RE = re.compile(rb'"timestamp":\s*"([^"]+)"')
+_TAGS_FIELD_RE = re.compile(rb'"tags":\s*\[([^\]]*)\]')
+_EXPORT_FIELDS_RE = re.compile(
+    rb'"timestamp":\s*"(?P<ts>[^"]+)",\s*"entry":\s*"(?P<entry>(?:[^"\\]|\\.)*)"'
+    rb'(?:,\s*"tags":\s*\[(?P<tags>[^\]]*)\])?'
+)
+
+
+def _prefilter_safe(text: str) -> bool:
+    """
+    True when text's bytes appear verbatim in the stored JSON line.
+
+    Quotes, backslashes and control characters are written escaped
+    (\\", \\\\, \\t, ...), so a raw-bytes needle containing them would
+    never match the line and the prefilter would drop real matches.
+    Non-ASCII is excluded too, because bytes-level case folding only
+    handles ASCII. Needles that fail this test must skip the prefilter
+    and go straight to the JSON parse.
+    """
+    return text.isascii() and not any(
+        ch in '"\\' or ord(ch) < 0x20 for ch in text
+    )
+
+
+def _intern_tags(tags: list) -> list:
+    """
+    Intern tag strings so repeats share one object.
+
+    PERFORMANCE: The JSON parser hands back a fresh str per tag per entry.
+    Interned tags let dict/Counter lookups hit the pointer-equality fast
+    path instead of hashing and comparing characters — a real win on
+    journals where the same few tags repeat for thousands of entries.
+    """
+    if not tags:
+        return tags
+    return [sys.intern(tag) if isinstance(tag, str) else tag for tag in tags]
+
+
+def _iter_raw_lines(log_path: Path, start: int = 0) -> Generator[bytes, None, None]:
+    """
+    Yield each line of the journal as raw bytes, without parsing.
+
+    PERFORMANCE: Large journals are mapped into memory with mmap and split
+    by scanning for newlines with mmap.find (a C memchr). That reads pages
+    straight from the page cache, skips the readline state machine, and
+    keeps memory use flat no matter how big the file is. Small files stick
+    with plain buffered reads, which win on setup cost.
+
+    `start` is a byte offset to begin from; it must land on a line start
+    (callers get one from the sidecar index, see _since_start_offset).
+
+    Compressed archives (.gz/.zst) are decompressed on the fly — the rest
+    of the pipeline sees the same raw lines either way.
+    """
+    if log_path.suffix in _COMPRESSED_SUFFIXES:
+        try:
+            with _open_compressed(log_path) as handle:
+                if start:
+                    handle.seek(start)
+                yield from handle
+        except OSError:
+            raise  # Includes gzip.BadGzipFile and the missing-zstandard error
+        except Exception as exc:
+            # zstandard.ZstdError does not subclass OSError — normalize it
+            # so command handlers only have to catch OSError.
+            raise OSError(str(exc)) from exc
+        return
+
+    if log_path.stat().st_size > _MMAP_THRESHOLD:
+        with log_path.open("rb") as handle:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                if numpy is not None:
+                    # PERFORMANCE: One SIMD-vectorized comparison over the
+                    # whole buffer extracts every newline offset at memory
+                    # bandwidth; the loop below just slices between them.
+                    offsets = numpy.flatnonzero(
+                        numpy.frombuffer(mm, dtype=numpy.uint8) == 0x0A
+                    )
+                    first = int(numpy.searchsorted(offsets, start)) if start else 0
+                    for newline in offsets[first:].tolist():
+                        yield mm[start:newline]
+                        start = newline + 1
+                    if start < size:
+                        yield mm[start:size]
+                else:
+                    while start < size:
+                        newline = mm.find(b"\n", start)
+                        if newline == -1:
+                            newline = size
+                        yield mm[start:newline]
+                        start = newline + 1
+    else:
+        with log_path.open("rb") as handle:
+            if start:
+                handle.seek(start)
+            yield from handle
+
+
 def load_entries(log_path: Path) -> Generator[dict, None, None]:
     """
     Load all entries from the journal file.
@@ -58,17 +293,416 @@ def load_entries(log_path: Path) -> Generator[dict, None, None]:
     """
     if not log_path.exists():
         return  # Empty generator
-    
-    with log_path.open("r", encoding="utf-8") as handle:
-        for line_num, line in enumerate(handle, start=1):
-            line = line.strip()
-            if not line:
-                continue
+
+    if log_path.suffix == ".bin":
+        yield from _iter_binary_entries(log_path)
+        return
+
+    # PERFORMANCE: Read in binary mode — binary file objects still split on
+    # newlines, and orjson parses bytes directly, so we never pay for a
+    # per-line str decode. Both parsers tolerate the trailing "\n".
+    loads = _loads
+
+    for line_num, line in enumerate(_iter_raw_lines(log_path), start=1):
+        if not line.strip():
+            continue
+        try:
+            entry = loads(line)
+        except ValueError:
+            # Log to stderr but keep going
+            print(f"Warning: Invalid JSON on line {line_num}", file=sys.stderr)
+            continue
+        if "tags" in entry:
+            entry["tags"] = _intern_tags(entry["tags"])
+        yield entry
+
+
+# Cached append fds and already-created parent dirs, keyed by path. A CLI
+# invocation only touches one file, but library callers looping on cmd_add
+# skip the per-entry open/close and mkdir this way.
+_append_fds: dict[Path, int] = {}
+_parents_made: set[Path] = set()
+
+
+def _get_append_fd(log_path: Path) -> int:
+    """
+    Return a cached O_APPEND file descriptor for log_path.
+
+    PERFORMANCE: O_APPEND writes are atomic per POSIX for small payloads,
+    so a single os.write replaces Python's buffered-IO setup plus the
+    open/write/close syscall trio — and the fd survives across calls.
+    """
+    fd = _append_fds.get(log_path)
+    if fd is None:
+        parent = log_path.parent
+        if parent not in _parents_made:
+            parent.mkdir(parents=True, exist_ok=True)
+            _parents_made.add(parent)
+        fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        _append_fds[log_path] = fd
+    return fd
+
+
+@atexit.register
+def _close_append_fds() -> None:
+    for fd in _append_fds.values():
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+    _append_fds.clear()
+
+
+# BINARY JOURNAL FORMAT
+#
+# Optional compact format for power users (see the `compact` command, or
+# point --log at a .bin file directly). Each record is
+#
+#     [u64 unix nanoseconds][u16 tag bitmap][u32 entry length][utf-8 entry]
+#
+# with tag names kept in a <journal>.bin.tags.tsv sidecar (bit -> name, 16
+# tags max). Roughly half the bytes of JSONL, and scans decode fixed
+# fields with struct instead of parsing JSON at all.
+
+_BIN_RECORD = struct.Struct("<QHI")
+
+
+def _tag_table_path(bin_path: Path) -> Path:
+    return bin_path.with_name(bin_path.name + ".tags.tsv")
+
+
+def _load_tag_table(bin_path: Path) -> list[str]:
+    """Tag names indexed by bitmap bit, from the .tags.tsv sidecar."""
+    path = _tag_table_path(bin_path)
+    if not path.exists():
+        return []
+    return [
+        line.split("\t", 1)[1]
+        for line in path.read_text(encoding="utf-8").splitlines()
+        if "\t" in line
+    ]
+
+
+# Tag tables cached per path so writers (compact in particular, which
+# calls _tag_bitmap once per entry) read the sidecar once, not per call.
+_tag_tables: dict[Path, list[str]] = {}
+
+
+def _tag_bitmap(bin_path: Path, tags: list[str]) -> int:
+    """Map tag names to bits, growing the sidecar table as needed."""
+    table = _tag_tables.get(bin_path)
+    if table is None:
+        table = _tag_tables[bin_path] = _load_tag_table(bin_path)
+    bits = 0
+    for tag in tags:
+        if tag in table:
+            bit = table.index(tag)
+        elif len(table) < 16:
+            bit = len(table)
+            table.append(tag)
+            with _tag_table_path(bin_path).open("a", encoding="utf-8") as handle:
+                handle.write(f"{bit}\t{tag}\n")
+        else:
+            # The u16 bitmap caps a binary journal at 16 distinct tags
+            print(f"Warning: tag table full, dropping tag {tag!r}", file=sys.stderr)
+            continue
+        bits |= 1 << bit
+    return bits
+
+
+def _pack_record(ts_ns: int, tag_bits: int, text: str) -> bytes:
+    data = text.encode("utf-8")
+    return _BIN_RECORD.pack(ts_ns, tag_bits, len(data)) + data
+
+
+def _iter_binary_entries(bin_path: Path) -> Generator[dict, None, None]:
+    """Yield entry dicts from a .bin journal, shaped like the JSONL ones."""
+    if not bin_path.exists() or bin_path.stat().st_size == 0:
+        return
+    table = _load_tag_table(bin_path)
+    header = _BIN_RECORD
+    with bin_path.open("rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            offset = 0
+            while offset + header.size <= size:
+                ts_ns, tag_bits, length = header.unpack_from(mm, offset)
+                offset += header.size
+                if offset + length > size:
+                    print("Warning: truncated binary record", file=sys.stderr)
+                    break
+                text = mm[offset:offset + length].decode("utf-8", "replace")
+                offset += length
+
+                when = datetime.fromtimestamp(ts_ns // 10**9, timezone.utc)
+                entry = {
+                    "timestamp": when.astimezone().isoformat(timespec="seconds"),
+                    "entry": text,
+                }
+                if tag_bits:
+                    entry["tags"] = [
+                        table[bit]
+                        for bit in range(len(table))
+                        if tag_bits >> bit & 1
+                    ]
+                yield entry
+
+
+# PARALLEL SCANS
+#
+# count and search are embarrassingly parallel over lines and CPU-bound on
+# JSON parsing, so big journals are split into newline-aligned byte ranges
+# processed by worker processes; the parent merges the per-chunk results.
+
+# Journals above this size get a process pool in count/search.
+_PARALLEL_THRESHOLD = 8 << 20  # 8 MiB
+
+# replay/export buffer output and flush to stdout in chunks of this size.
+_STDOUT_FLUSH = 1 << 20  # 1 MiB
+
+
+def _chunk_offsets(log_path: Path, n_chunks: int) -> list[tuple[int, int]]:
+    """Split the file into newline-aligned (start, end) byte ranges."""
+    size = log_path.stat().st_size
+    bounds = [0]
+    with log_path.open("rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for i in range(1, n_chunks):
+                guess = size * i // n_chunks
+                if guess <= bounds[-1]:
+                    continue
+                newline = mm.find(b"\n", guess)
+                if newline == -1:
+                    break
+                bounds.append(newline + 1)
+    bounds.append(size)
+    return [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if lo < hi]
+
+
+def _iter_range_lines(path_str: str, lo: int, hi: int) -> Generator[bytes, None, None]:
+    """Yield raw lines from a byte range of the file (worker-side)."""
+    with open(path_str, "rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            while lo < hi:
+                newline = mm.find(b"\n", lo, hi)
+                if newline == -1:
+                    newline = hi
+                yield mm[lo:newline]
+                lo = newline + 1
+
+
+def _extract_count_fields(
+    line: bytes,
+    loads,
+    # PERFORMANCE: Default-argument binding resolves the regex methods once
+    # at def time, so the per-line calls are LOAD_FAST instead of two
+    # global+attribute lookups. The closest this single-file, stdlib-only
+    # tool gets to compiling the inner loop.
+    _ts_search=_TS_FIELD_RE.search,
+    _tags_search=_TAGS_FIELD_RE.search,
+) -> Optional[tuple[str, list]]:
+    """
+    Pull (timestamp, tags) out of a raw line without a full parse.
+
+    Uses the field regexes when they apply, falling back to a full JSON
+    parse otherwise. Returns None when the line is not valid JSON.
+
+    A line torn by a crash mid-write can keep an intact timestamp field,
+    so the regex fast path only fires on lines ending with "}" — the
+    cheap structural check a torn write virtually never passes. Anything
+    else takes the full parse, which reports it as invalid.
+    """
+    ts_match = _ts_search(line) if line.rstrip().endswith(b"}") else None
+    if ts_match:
+        try:
+            ts_string = ts_match.group(1).decode("utf-8")
+            tags_match = _tags_search(line)
+            tags = loads(b"[" + tags_match.group(1) + b"]") if tags_match else []
+            return ts_string, _intern_tags(tags)
+        except ValueError:
+            pass
+    try:
+        entry = loads(line)
+    except ValueError:
+        return None
+    return entry.get("timestamp", ""), _intern_tags(entry.get("tags", []))
+
+
+def _count_chunk(
+    args: tuple[str, int, int],
+) -> tuple[int, Counter, Optional[str], Optional[str], int]:
+    """Worker: fused count over one byte range of the journal."""
+    path_str, lo, hi = args
+    loads = _loads
+    total = 0
+    invalid = 0
+    tag_counts: Counter[str] = Counter()
+    earliest: Optional[str] = None
+    latest: Optional[str] = None
+
+    # PERFORMANCE: Bind the hot callables to locals outside the loop
+    extract = _extract_count_fields
+    update_tags = tag_counts.update
+
+    for line in _iter_range_lines(path_str, lo, hi):
+        if not line.strip():
+            continue
+        fields = extract(line, loads)
+        if fields is None:
+            invalid += 1
+            continue
+        ts_string, tags = fields
+        total += 1
+        update_tags(tags)
+        if ts_string:
+            if earliest is None or ts_string < earliest:
+                earliest = ts_string
+            if latest is None or ts_string > latest:
+                latest = ts_string
+
+    return total, tag_counts, earliest, latest, invalid
+
+
+def _search_chunk(args: tuple[str, int, int, tuple, bool]) -> tuple[list[str], int]:
+    """Worker: search one byte range; returns (output lines, match count)."""
+    path_str, lo, hi, keywords, case_sensitive = args
+    # Compiled patterns do not pickle, so each worker compiles its own.
+    flags = 0 if case_sensitive else re.IGNORECASE
+    pattern = re.compile("|".join(map(re.escape, keywords)), flags)
+    prefilter = None
+    if all(_prefilter_safe(keyword) for keyword in keywords):
+        prefilter = re.compile(
+            b"|".join(re.escape(keyword.encode("utf-8")) for keyword in keywords),
+            flags,
+        )
+    loads = _loads
+
+    output: list[str] = []
+    matches = 0
+    for line in _iter_range_lines(path_str, lo, hi):
+        if not line.strip():
+            continue
+        if prefilter is not None and prefilter.search(line) is None:
+            continue
+        try:
+            entry = loads(line)
+        except ValueError:
+            continue
+        text = entry.get("entry", "")
+        if pattern.search(text):
+            output.append(f"{entry.get('timestamp', 'unknown')} | {text}")
+            matches += 1
+    return output, matches
+
+
+# SIDECAR INDEX
+#
+# journal.jsonl gets a tiny journal.jsonl.idx sidecar holding one
+# "YYYY-MM-DD<TAB>byte_offset" row for the first entry of each day. Replay
+# with --since bisects it and seeks straight to the first candidate day
+# instead of scanning (and parsing) the whole journal from byte zero.
+
+# Last date written to each index, so repeat adds skip the file read.
+# None means "do not index this journal" (see _update_since_index).
+_index_last_date: dict[Path, Optional[str]] = {}
+
+
+def _index_path(log_path: Path) -> Path:
+    return log_path.with_name(log_path.name + ".idx")
+
+
+def _update_since_index(log_path: Path, ts_string: str, offset: int) -> None:
+    """Record the byte offset of the first entry of each day."""
+    date = ts_string[:10]
+
+    if log_path not in _index_last_date:
+        index_path = _index_path(log_path)
+        if index_path.exists():
             try:
-                yield json.loads(line)
-            except json.JSONDecodeError:
-                # Log to stderr but keep going
-                print(f"Warning: Invalid JSON on line {line_num}", file=sys.stderr)
+                rows = index_path.read_bytes().splitlines()
+                _index_last_date[log_path] = (
+                    rows[-1].split(b"\t")[0].decode("ascii") if rows else ""
+                )
+            except (OSError, UnicodeDecodeError):
+                _index_last_date[log_path] = None
+        elif offset == 0:
+            _index_last_date[log_path] = ""  # Fresh journal — start indexing
+        else:
+            # Journal predates the index. A partial index would lie about
+            # earlier days, so leave building it to replay's full scan.
+            _index_last_date[log_path] = None
+
+    last = _index_last_date[log_path]
+    if last is None or date == last:
+        return
+
+    try:
+        with _index_path(log_path).open("a", encoding="utf-8") as handle:
+            handle.write(f"{date}\t{offset}\n")
+        _index_last_date[log_path] = date
+    except OSError:
+        _index_last_date[log_path] = None  # Best effort — never fail an add
+
+
+def _build_since_index(log_path: Path) -> list[tuple[str, int]]:
+    """Rebuild the day -> offset index with one full scan of the journal."""
+    rows: list[tuple[str, int]] = []
+    last_date = None
+    offset = 0
+    with log_path.open("rb") as handle:
+        for line in handle:
+            match = _TS_FIELD_RE.search(line)
+            if match:
+                date = match.group(1)[:10].decode("utf-8", "replace")
+                if date != last_date:
+                    rows.append((date, offset))
+                    last_date = date
+            offset += len(line)
+
+    try:
+        with _index_path(log_path).open("w", encoding="utf-8") as handle:
+            for date, off in rows:
+                handle.write(f"{date}\t{off}\n")
+    except OSError:
+        pass  # The in-memory rows are still usable for this run
+
+    return rows
+
+
+def _since_start_offset(log_path: Path, since_date: datetime) -> int:
+    """
+    Byte offset replay --since should start scanning from.
+
+    Reads the sidecar index (rebuilding it if missing or stale) and
+    bisects for the day before the cutoff — one day of slack absorbs any
+    difference between the entry's UTC offset and the --since one. Any
+    problem with the index falls back to offset 0, i.e. a full scan.
+    """
+    try:
+        size = log_path.stat().st_size
+        rows: list[tuple[str, int]] = []
+        index_path = _index_path(log_path)
+        if index_path.exists():
+            for row in index_path.read_bytes().splitlines():
+                date_bytes, _, off_bytes = row.partition(b"\t")
+                rows.append((date_bytes.decode("ascii"), int(off_bytes)))
+        if not rows or rows[-1][1] >= size:
+            rows = _build_since_index(log_path)
+        if not rows:
+            return 0
+
+        target = (since_date.date() - timedelta(days=1)).isoformat()
+        dates = [date for date, _ in rows]
+        if any(a > b for a, b in zip(dates, dates[1:])):
+            # Timestamps out of order (hand-edited journal?) — bisect
+            # would skip entries, so scan everything.
+            return 0
+        position = bisect.bisect_left(dates, target)
+        if position >= len(rows):
+            position = len(rows) - 1
+        return rows[position][1]
+    except (OSError, ValueError, UnicodeDecodeError):
+        return 0
 
 
 # COMMAND HANDLERS
@@ -79,19 +713,36 @@ def cmd_add(log_path: Path, text: str, tags: Optional[list[str]] = None) -> int:
     
     IMPROVED: Now supports optional tags for organization.
     """
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    
+    if log_path.suffix in _COMPRESSED_SUFFIXES:
+        print(f"Cannot append to compressed journal {log_path}", file=sys.stderr)
+        return 1
+
+    if log_path.suffix == ".bin":
+        fd = _get_append_fd(log_path)  # First: creates the parent dir
+        record = _pack_record(time.time_ns(), _tag_bitmap(log_path, tags or []), text)
+        os.write(fd, record)
+        print(f"✓ Entry added to {log_path}")
+        if tags:
+            print(f"  Tags: {', '.join(tags)}")
+        return 0
+
     payload = {
         "timestamp": iso_timestamp(),
         "entry": text,
     }
-    
+
     # Only add tags key if tags were provided
     if tags:
         payload["tags"] = tags
     
-    with log_path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(payload, ensure_ascii=True) + "\n")
+    # PERFORMANCE: Serialize straight to bytes and write in binary append
+    # mode — with orjson behind _dumps this skips the text codec entirely.
+    line = _dumps(payload) + b"\n"
+
+    fd = _get_append_fd(log_path)
+    offset = os.fstat(fd).st_size
+    os.write(fd, line)
+    _update_since_index(log_path, payload["timestamp"], offset)
     
     print(f"✓ Entry added to {log_path}")
     if tags:
@@ -100,6 +751,66 @@ def cmd_add(log_path: Path, text: str, tags: Optional[list[str]] = None) -> int:
     return 0
 
 
+def cmd_add_many(
+    log_path: Path,
+    lines: Iterable[str],
+    tags: Optional[list[str]] = None,
+) -> int:
+    """
+    Append many entries in a single write.
+
+    NEW COMMAND: Reads newline-delimited text (one entry per line) and
+    serializes the whole batch into one buffer before touching the file.
+
+    PERFORMANCE: Scripts that loop calling `add` pay the open/write/close
+    cost once per entry. Batching amortizes it across the whole import:
+    one open, one write, however many entries.
+    """
+    if log_path.suffix in _COMPRESSED_SUFFIXES:
+        print(f"Cannot append to compressed journal {log_path}", file=sys.stderr)
+        return 1
+
+    if log_path.suffix == ".bin":
+        fd = _get_append_fd(log_path)  # First: creates the parent dir
+        tag_bits = _tag_bitmap(log_path, tags or [])
+        buf = bytearray()
+        added = 0
+        for text in lines:
+            text = text.rstrip("\n")
+            if not text:
+                continue
+            buf += _pack_record(time.time_ns(), tag_bits, text)
+            added += 1
+        if buf:
+            os.write(fd, buf)
+        print(f"✓ Added {added} entries to {log_path}")
+        return 0
+
+    chunks = []
+    timestamps = []
+    for text in lines:
+        text = text.rstrip("\n")
+        if not text:
+            continue
+        payload = {"timestamp": _iso_timestamp_fast(), "entry": text}
+        if tags:
+            payload["tags"] = tags
+        chunks.append(_dumps(payload))
+        timestamps.append(payload["timestamp"])
+
+    if chunks:
+        buf = b"\n".join(chunks) + b"\n"
+        fd = _get_append_fd(log_path)
+        offset = os.fstat(fd).st_size
+        os.write(fd, buf)
+        for chunk, ts_string in zip(chunks, timestamps):
+            _update_since_index(log_path, ts_string, offset)
+            offset += len(chunk) + 1
+
+    print(f"✓ Added {len(chunks)} entries to {log_path}")
+    return 0
+
+
 def cmd_replay(
     log_path: Path,
     since: Optional[str] = None,
@@ -127,60 +838,198 @@ def cmd_replay(
             print(f"Invalid date format: {since}", file=sys.stderr)
             return 1
     
+    # PERFORMANCE: Lowercase the tag filter once instead of per entry, and
+    # build a quoted-bytes needle so lines that cannot contain the tag are
+    # skipped before the JSON parse. Only tags whose bytes appear verbatim
+    # in stored lines qualify (see _prefilter_safe); the real tag check
+    # still runs after parsing.
+    tag_lower = tag_filter.lower() if tag_filter else None
+    tag_needle = None
+    if tag_filter and _prefilter_safe(tag_filter):
+        tag_needle = b'"' + tag_lower.encode("utf-8") + b'"'
+
     entries_shown = 0
-    
-    for entry in load_entries(log_path):
-        # Apply date filter
-        if since_date:
-            entry_date = parse_timestamp(entry.get("timestamp", ""))
-            if entry_date and entry_date < since_date:
-                continue
-        
-        # Apply tag filter
-        if tag_filter:
-            entry_tags = entry.get("tags", [])
-            if tag_filter.lower() not in [t.lower() for t in entry_tags]:
-                continue
-        
-        # Display the entry
-        timestamp = entry.get("timestamp", "unknown")
-        text = entry.get("entry", "")
-        tags = entry.get("tags", [])
-        
-        print(f"{timestamp} | {text}")
-        if tags:
-            print(f"  └─ tags: {', '.join(tags)}")
-        
-        entries_shown += 1
-    
+
+    # PERFORMANCE: print() acquires the stdout lock and issues two writes
+    # per call. Accumulate output in a bytearray and hand stdout ~1 MiB at
+    # a time instead — thousands of syscalls become a handful.
+    out = bytearray()
+
+    if log_path.suffix == ".bin":
+        candidates = _iter_binary_entries(log_path)
+    else:
+        # PERFORMANCE: With --since, seek straight to the first candidate
+        # day via the sidecar index instead of scanning from byte zero.
+        start_offset = 0
+        if since_date and log_path.suffix not in _COMPRESSED_SUFFIXES:
+            start_offset = _since_start_offset(log_path, since_date)
+
+        def _jsonl_candidates() -> Generator[dict, None, None]:
+            loads = _loads
+            for line_num, line in enumerate(
+                _iter_raw_lines(log_path, start_offset), start=1
+            ):
+                if not line.strip():
+                    continue
+                if tag_needle is not None and tag_needle not in line.lower():
+                    continue
+                try:
+                    yield loads(line)
+                except ValueError:
+                    print(f"Warning: Invalid JSON on line {line_num}", file=sys.stderr)
+
+        candidates = _jsonl_candidates()
+
+    # PERFORMANCE: Convert the cutoff to epoch nanoseconds once, so the
+    # per-entry date filter is an int compare instead of a datetime one.
+    since_ns = None
+    if since_date:
+        since_ns = int(since_date.timestamp()) * 1_000_000_000
+
+    try:
+        for entry in candidates:
+            # Apply date filter
+            if since_ns is not None:
+                ts_string = entry.get("timestamp", "")
+                entry_ns = _ts_to_ns(ts_string)
+                if entry_ns is not None:
+                    if entry_ns < since_ns:
+                        continue
+                else:
+                    # Odd timestamp shape — fall back to datetime comparison
+                    entry_date = parse_timestamp(ts_string)
+                    if entry_date and entry_date < since_date:
+                        continue
+
+            # Apply tag filter
+            if tag_lower:
+                entry_tags = entry.get("tags", [])
+                if tag_lower not in [t.lower() for t in entry_tags]:
+                    continue
+
+            # Display the entry
+            timestamp = entry.get("timestamp", "unknown")
+            text = entry.get("entry", "")
+            tags = entry.get("tags", [])
+
+            out += f"{timestamp} | {text}\n".encode("utf-8")
+            if tags:
+                out += f"  └─ tags: {', '.join(tags)}\n".encode("utf-8")
+            if len(out) > _STDOUT_FLUSH:
+                sys.stdout.buffer.write(out)
+                out.clear()
+
+            entries_shown += 1
+    except BrokenPipeError:
+        raise
+    except OSError as exc:
+        # Compressed journals can fail mid-read (corrupt archive, missing
+        # zstandard); report it like any other unusable journal.
+        print(f"Error reading {log_path}: {exc}", file=sys.stderr)
+        return 1
+
+    if out:
+        sys.stdout.buffer.write(out)
+    sys.stdout.buffer.flush()
+
     if entries_shown == 0:
         print("No entries match your filters.", file=sys.stderr)
-    
+
     return 0
 
 
-def cmd_search(log_path: Path, keyword: str, case_sensitive: bool = False) -> int:
+def cmd_search(log_path: Path, keywords: list[str], case_sensitive: bool = False) -> int:
     """
-    Search entries for a keyword.
-    
+    Search entries for one or more keywords.
+
     NEW COMMAND: Demonstrates string searching and case handling.
+
+    IMPROVED: Accepts several keywords and shows entries matching any of
+    them.
+
+    PERFORMANCE: All keywords are escaped and joined into one precompiled
+    alternation, so each line is scanned once by the regex engine no
+    matter how many keywords were given — instead of one containment pass
+    per keyword.
     """
     if not log_path.exists():
         print(f"No journal found at {log_path}", file=sys.stderr)
         return 1
-    
+
     matches = 0
-    search_term = keyword if case_sensitive else keyword.lower()
-    
-    for entry in load_entries(log_path):
-        text = entry.get("entry", "")
-        compare_text = text if case_sensitive else text.lower()
-        
-        if search_term in compare_text:
-            timestamp = entry.get("timestamp", "unknown")
-            print(f"{timestamp} | {text}")
-            matches += 1
-    
+    flags = 0 if case_sensitive else re.IGNORECASE
+    pattern = re.compile("|".join(map(re.escape, keywords)), flags)
+
+    if log_path.suffix == ".bin":
+        for entry in _iter_binary_entries(log_path):
+            text = entry.get("entry", "")
+            if pattern.search(text):
+                print(f"{entry.get('timestamp', 'unknown')} | {text}")
+                matches += 1
+        print(f"\n─── Found {matches} matching entries ───")
+        return 0
+
+    # PERFORMANCE: Like count, big journals are searched in parallel over
+    # newline-aligned chunks; workers return their matches and the parent
+    # prints them in chunk order, so output order is unchanged.
+    n_workers = os.cpu_count() or 1
+    if (
+        log_path.suffix not in _COMPRESSED_SUFFIXES
+        and log_path.stat().st_size > _PARALLEL_THRESHOLD
+        and n_workers > 1
+    ):
+        from concurrent.futures import ProcessPoolExecutor  # Lazy: slow import
+
+        chunks = _chunk_offsets(log_path, n_workers)
+        work = [
+            (str(log_path), lo, hi, tuple(keywords), case_sensitive)
+            for lo, hi in chunks
+        ]
+        with ProcessPoolExecutor(max_workers=len(work)) as pool:
+            for output, sub_matches in pool.map(_search_chunk, work):
+                for line in output:
+                    print(line)
+                matches += sub_matches
+        print(f"\n─── Found {matches} matching entries ───")
+        return 0
+
+    # PERFORMANCE: Most lines do not match, so run the same alternation
+    # over the raw bytes first and skip non-candidates without paying for
+    # a JSON parse. Only keywords whose bytes appear verbatim in stored
+    # lines qualify (see _prefilter_safe) — anything else skips the
+    # prefilter rather than risk missing matches.
+    prefilter = None
+    if all(_prefilter_safe(keyword) for keyword in keywords):
+        prefilter = re.compile(
+            b"|".join(re.escape(keyword.encode("utf-8")) for keyword in keywords),
+            flags,
+        )
+
+    loads = _loads
+
+    try:
+        for line in _iter_raw_lines(log_path):
+            if not line.strip():
+                continue
+            if prefilter is not None and prefilter.search(line) is None:
+                continue
+            try:
+                entry = loads(line)
+            except ValueError:
+                continue
+
+            text = entry.get("entry", "")
+            if pattern.search(text):
+                timestamp = entry.get("timestamp", "unknown")
+                print(f"{timestamp} | {text}")
+                matches += 1
+    except BrokenPipeError:
+        raise
+    except OSError as exc:
+        print(f"Error reading {log_path}: {exc}", file=sys.stderr)
+        return 1
+
+
     print(f"\n─── Found {matches} matching entries ───")
     return 0
 
@@ -196,36 +1045,96 @@ def cmd_count(log_path: Path) -> int:
         return 1
     
     total = 0
-    tag_counts: dict[str, int] = {}  # NEW: Type hint for dict
-    earliest: Optional[datetime] = None
-    latest: Optional[datetime] = None
-    
-    for entry in load_entries(log_path):
-        total += 1
-        
-        # Count tags
-        for tag in entry.get("tags", []):
-            tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        
-        # Track date range
-        ts = parse_timestamp(entry.get("timestamp", ""))
-        if ts:
-            if earliest is None or ts < earliest:
-                earliest = ts
-            if latest is None or ts > latest:
-                latest = ts
-    
+    # PERFORMANCE: Counter.update walks the tag list in C — one call per
+    # entry instead of two dict lookups plus an add per tag.
+    tag_counts: Counter[str] = Counter()
+    earliest: Optional[str] = None
+    latest: Optional[str] = None
+
+    # PERFORMANCE: Big journals are counted by worker processes over
+    # newline-aligned byte ranges — JSON parsing scales with cores and the
+    # per-chunk results merge cheaply. Small files stay serial, where the
+    # fused partial parse (timestamp + tags only, no full entry dict) and
+    # lexical ISO-8601 min/max already do the heavy lifting.
+    n_workers = os.cpu_count() or 1
+    if log_path.suffix == ".bin":
+        # Binary records already carry decoded timestamps and tags
+        for entry in _iter_binary_entries(log_path):
+            total += 1
+            tag_counts.update(entry.get("tags", ()))
+            ts_string = entry.get("timestamp", "")
+            if ts_string:
+                if earliest is None or ts_string < earliest:
+                    earliest = ts_string
+                if latest is None or ts_string > latest:
+                    latest = ts_string
+    elif (
+        log_path.suffix not in _COMPRESSED_SUFFIXES
+        and log_path.stat().st_size > _PARALLEL_THRESHOLD
+        and n_workers > 1
+    ):
+        from concurrent.futures import ProcessPoolExecutor  # Lazy: slow import
+
+        chunks = _chunk_offsets(log_path, n_workers)
+        work = [(str(log_path), lo, hi) for lo, hi in chunks]
+        invalid = 0
+        with ProcessPoolExecutor(max_workers=len(work)) as pool:
+            for sub_total, sub_tags, sub_earliest, sub_latest, sub_invalid in pool.map(
+                _count_chunk, work
+            ):
+                total += sub_total
+                invalid += sub_invalid
+                tag_counts.update(sub_tags)
+                if sub_earliest and (earliest is None or sub_earliest < earliest):
+                    earliest = sub_earliest
+                if sub_latest and (latest is None or sub_latest > latest):
+                    latest = sub_latest
+        if invalid:
+            print(f"Warning: Skipped {invalid} invalid JSON lines", file=sys.stderr)
+    else:
+        loads = _loads
+        extract = _extract_count_fields
+        update_tags = tag_counts.update
+
+        try:
+            for line_num, line in enumerate(_iter_raw_lines(log_path), start=1):
+                if not line.strip():
+                    continue
+                fields = extract(line, loads)
+                if fields is None:
+                    print(f"Warning: Invalid JSON on line {line_num}", file=sys.stderr)
+                    continue
+                ts_string, tags = fields
+
+                total += 1
+
+                # Count tags
+                update_tags(tags)
+
+                # Track date range — raw ISO-8601 strings compare lexically.
+                if ts_string:
+                    if earliest is None or ts_string < earliest:
+                        earliest = ts_string
+                    if latest is None or ts_string > latest:
+                        latest = ts_string
+        except OSError as exc:
+            print(f"Error reading {log_path}: {exc}", file=sys.stderr)
+            return 1
+
     # Display statistics
     print(f"📊 Journal Statistics")
     print(f"   Total entries: {total}")
-    
+
     if earliest and latest:
-        print(f"   Date range: {earliest.date()} to {latest.date()}")
+        first = parse_timestamp(earliest)
+        last = parse_timestamp(latest)
+        if first and last:
+            print(f"   Date range: {first.date()} to {last.date()}")
     
     if tag_counts:
         print(f"   Tags used:")
-        # Sort by count descending
-        for tag, count in sorted(tag_counts.items(), key=lambda x: -x[1]):
+        # Counter.most_common sorts by count descending for us
+        for tag, count in tag_counts.most_common():
             print(f"      {tag}: {count}")
     
     return 0
@@ -243,42 +1152,172 @@ def cmd_export(log_path: Path, format: str = "markdown") -> int:
         return 1
     
     if format == "markdown":
-        print("# Journal Export\n")
-        
+        # PERFORMANCE: Same batched-stdout trick as replay — build output
+        # in a bytearray and flush in ~1 MiB chunks instead of one print
+        # (two writes + a lock) per line.
+        out = bytearray(b"# Journal Export\n\n")
+
         current_date = None
-        
-        for entry in load_entries(log_path):
-            ts = parse_timestamp(entry.get("timestamp", ""))
-            text = entry.get("entry", "")
-            tags = entry.get("tags", [])
-            
-            # Group by date with headers
-            if ts:
-                entry_date = ts.strftime("%Y-%m-%d")
-                if entry_date != current_date:
-                    current_date = entry_date
-                    print(f"\n## {current_date}\n")
-            
-            # Format entry
-            time_str = ts.strftime("%H:%M") if ts else "??:??"
-            print(f"- **{time_str}** — {text}")
-            if tags:
-                print(f"  - *Tags: {', '.join(tags)}*")
-        
+
+        try:
+            for ts_string, text, tags in _iter_export_fields(log_path):
+                ts = parse_timestamp(ts_string)
+
+                # Group by date with headers
+                if ts:
+                    entry_date = ts.strftime("%Y-%m-%d")
+                    if entry_date != current_date:
+                        current_date = entry_date
+                        out += f"\n## {current_date}\n\n".encode("utf-8")
+
+                # Format entry
+                time_str = ts.strftime("%H:%M") if ts else "??:??"
+                out += f"- **{time_str}** — {text}\n".encode("utf-8")
+                if tags:
+                    out += f"  - *Tags: {', '.join(tags)}*\n".encode("utf-8")
+
+                if len(out) > _STDOUT_FLUSH:
+                    sys.stdout.buffer.write(out)
+                    out.clear()
+        except BrokenPipeError:
+            raise
+        except OSError as exc:
+            print(f"Error reading {log_path}: {exc}", file=sys.stderr)
+            return 1
+
+        if out:
+            sys.stdout.buffer.write(out)
+        sys.stdout.buffer.flush()
         return 0
     
     print(f"Unknown format: {format}", file=sys.stderr)
     return 1
 
 
+def _iter_export_fields(
+    log_path: Path,
+) -> Generator[tuple[str, str, list], None, None]:
+    """
+    Yield (timestamp, entry text, tags) per entry for export.
+
+    PERFORMANCE: Export only re-formats three fields, so pull them out of
+    each raw line with one regex and skip building the full entry dict.
+    Entries whose text contains escape sequences — which need real JSON
+    unescaping — and lines the regex misses take the full-parse fallback,
+    so output is identical either way.
+    """
+    if log_path.suffix == ".bin":
+        for entry in _iter_binary_entries(log_path):
+            yield (
+                entry.get("timestamp", ""),
+                entry.get("entry", ""),
+                entry.get("tags", []),
+            )
+        return
+
+    loads = _loads
+    search = _EXPORT_FIELDS_RE.search
+
+    for line_num, line in enumerate(_iter_raw_lines(log_path), start=1):
+        if not line.strip():
+            continue
+        # Same torn-line guard as _extract_count_fields: only trust the
+        # regex on lines ending with "}", and never when the line mentions
+        # "tags" but the optional tags group failed to capture it (e.g. a
+        # write torn inside the tags array).
+        match = search(line) if line.rstrip().endswith(b"}") else None
+        if (
+            match
+            and b"\\" not in match.group("entry")
+            and not (match.group("tags") is None and b'"tags"' in line)
+        ):
+            try:
+                tags_bytes = match.group("tags")
+                tags = loads(b"[" + tags_bytes + b"]") if tags_bytes else []
+                yield (
+                    match.group("ts").decode("utf-8"),
+                    match.group("entry").decode("utf-8"),
+                    tags,
+                )
+                continue
+            except (ValueError, UnicodeDecodeError):
+                pass  # Fall through to the full parse
+        try:
+            entry = loads(line)
+        except ValueError:
+            print(f"Warning: Invalid JSON on line {line_num}", file=sys.stderr)
+            continue
+        yield (
+            entry.get("timestamp", ""),
+            entry.get("entry", ""),
+            entry.get("tags", []),
+        )
+
+
+def cmd_compact(log_path: Path) -> int:
+    """
+    Convert a JSONL journal into the compact binary format.
+
+    NEW COMMAND: Writes <journal>.bin (plus a .tags.tsv tag table) next
+    to the source journal; point --log at the .bin file to use it.
+
+    PERFORMANCE: Each binary record is a fixed struct header plus the raw
+    entry text — about half the bytes of JSONL — and scanning it decodes
+    struct fields instead of parsing JSON at all.
+    """
+    if not log_path.exists():
+        print(f"No journal found at {log_path}", file=sys.stderr)
+        return 1
+    if log_path.suffix == ".bin":
+        print("Journal is already in binary format", file=sys.stderr)
+        return 1
+
+    bin_path = log_path.with_suffix(".bin")
+    # Start fresh so the tag table bits match the records we write
+    table_path = _tag_table_path(bin_path)
+    if table_path.exists():
+        table_path.unlink()
+    _tag_tables.pop(bin_path, None)
+
+    written = 0
+    try:
+        with bin_path.open("wb") as handle:
+            buf = bytearray()
+            for entry in load_entries(log_path):
+                ts = parse_timestamp(entry.get("timestamp", ""))
+                ts_ns = int(ts.timestamp()) * 10**9 if ts else 0
+                tag_bits = _tag_bitmap(bin_path, entry.get("tags", []))
+                buf += _pack_record(ts_ns, tag_bits, entry.get("entry", ""))
+                written += 1
+                if len(buf) > _STDOUT_FLUSH:
+                    handle.write(buf)
+                    buf.clear()
+            if buf:
+                handle.write(buf)
+    except OSError as exc:
+        # Don't leave a half-written .bin behind if the source was unreadable
+        bin_path.unlink(missing_ok=True)
+        print(f"Error reading {log_path}: {exc}", file=sys.stderr)
+        return 1
+
+    print(f"✓ Wrote {written} entries to {bin_path}")
+    return 0
+
+
 # ARGUMENT PARSER
 
-def build_parser() -> argparse.ArgumentParser:
+def build_parser() -> "argparse.ArgumentParser":
     """
     Build the command-line argument parser.
-    
+
     IMPROVED: More commands, better organization.
+
+    PERFORMANCE: argparse is imported here, not at module top — the `add`
+    fast path in main never needs it, and importing plus building the
+    subparser graph is a measurable share of cold start.
     """
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Append-only CLI journal with JSONL persistence.",
         # Custom formatter for better help text
@@ -287,10 +1326,12 @@ def build_parser() -> argparse.ArgumentParser:
 Examples:
   %(prog)s add "Had a great day"
   %(prog)s add "Fixed bug" --tags work,coding
+  cat notes.txt | %(prog)s add-batch --tags imported
   %(prog)s replay --since 2024-01-01
   %(prog)s search "coffee"
   %(prog)s count
   %(prog)s export --format markdown > journal.md
+  %(prog)s --log archive-2023.jsonl.gz count
         """
     )
     
@@ -310,6 +1351,16 @@ Examples:
         help="Comma-separated tags (e.g., work,important)",
     )
     
+    # --- ADD-BATCH command ---
+    batch_p = subparsers.add_parser(
+        "add-batch",
+        help="Add one entry per line read from stdin",
+    )
+    batch_p.add_argument(
+        "--tags", "-t",
+        help="Comma-separated tags applied to every entry in the batch",
+    )
+
     # --- REPLAY command ---
     replay_p = subparsers.add_parser("replay", help="Display journal entries")
     replay_p.add_argument(
@@ -323,7 +1374,11 @@ Examples:
     
     # --- SEARCH command ---
     search_p = subparsers.add_parser("search", help="Search entries")
-    search_p.add_argument("keyword", help="Text to search for")
+    search_p.add_argument(
+        "keyword",
+        nargs="+",
+        help="Text to search for (several keywords match entries containing any)",
+    )
     search_p.add_argument(
         "--case-sensitive", "-c",
         action="store_true",  # NEW: Boolean flag (no value needed)
@@ -332,6 +1387,12 @@ Examples:
     
     # --- COUNT command ---
     subparsers.add_parser("count", help="Show journal statistics")
+
+    # --- COMPACT command ---
+    subparsers.add_parser(
+        "compact",
+        help="Convert the journal to the compact binary format",
+    )
     
     # --- EXPORT command ---
     export_p = subparsers.add_parser("export", help="Export to other formats")
@@ -348,8 +1409,52 @@ Examples:
 
 # MAIN ENTRY POINT
 
+def _main_add_fast(argv: list[str]) -> Optional[int]:
+    """
+    Handle `journal.py add ...` without building the argparse graph.
+
+    PERFORMANCE: `add` is the overwhelmingly common invocation (think
+    shell loops) and needs none of argparse's subparser machinery, which
+    dominates cold start. Anything unusual returns None so main falls
+    back to the full parser, which also owns --help and error messages.
+    """
+    text = None
+    tags = None
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ("--tags", "-t"):
+            if i + 1 >= len(argv):
+                return None
+            # Empty value means no tags, matching the argparse path
+            value = argv[i + 1]
+            tags = value.split(",") if value else None
+            i += 2
+        elif arg.startswith("--tags="):
+            value = arg.split("=", 1)[1]
+            tags = value.split(",") if value else None
+            i += 1
+        elif arg.startswith("-"):
+            return None  # Unknown flag — let argparse report it
+        elif text is None:
+            text = arg
+            i += 1
+        else:
+            return None  # Extra positional — let argparse report it
+    if text is None:
+        return None
+    return cmd_add(Path(DEFAULT_LOG), text, tags)
+
+
 def main() -> int:
     """Main entry point - parse args and dispatch to handlers."""
+    # PERFORMANCE: Dispatch plain `add` invocations straight from sys.argv
+    # and skip argparse entirely.
+    if len(sys.argv) >= 2 and sys.argv[1] == "add":
+        result = _main_add_fast(sys.argv[2:])
+        if result is not None:
+            return result
+
     parser = build_parser()
     args = parser.parse_args()
     log_path = Path(args.log)
@@ -359,7 +1464,11 @@ def main() -> int:
     if args.command == "add":
         tags = args.tags.split(",") if args.tags else None
         return cmd_add(log_path, args.text, tags)
-    
+
+    elif args.command == "add-batch":
+        tags = args.tags.split(",") if args.tags else None
+        return cmd_add_many(log_path, sys.stdin, tags)
+
     elif args.command == "replay":
         return cmd_replay(log_path, args.since, args.tag)
     
@@ -368,6 +1477,9 @@ def main() -> int:
     
     elif args.command == "count":
         return cmd_count(log_path)
+
+    elif args.command == "compact":
+        return cmd_compact(log_path)
     
     elif args.command == "export":
         return cmd_export(log_path, args.format)